@@ -3,8 +3,6 @@ from datetime import timedelta
 import argparse
 import logging
 import orekitfactory.factory
-import astropy.units as u
-import matplotlib.pyplot as plt
 import orbit_tool.utils as utils
 
 from org.orekit.data import DataContext
@@ -64,7 +62,7 @@ def config_args(parser):
         "-o",
         "--output-format",
         type=str,
-        choices=["none", "csv"],
+        choices=["none", "csv", "parquet"],
         default="none",
         dest="format",
         help="Define the output format (or suppress it).",
@@ -86,6 +84,14 @@ def config_args(parser):
         help="Specify output as CSV. Equivalent to -o csv",
     )
 
+    out_group.add_argument(
+        "--parquet",
+        action="store_const",
+        const="parquet",
+        dest="format",
+        help="Specify output as parquet. Equivalent to -o parquet",
+    )
+
     parser.add_argument(
         "-f",
         "--file",
@@ -107,14 +113,11 @@ def execute(args=None) -> int:
         model="wgs84", frame="itrf", iersConventions="2010", simpleEop=False
     )
 
-    # load the tle
-    (orbit1, orbittype1) = utils.read_orbit(
-        orbit_name=args.orbits[0], config=config["orbits"], context=context
+    # load the orbits, parsing (or downloading) a repeated orbit only once
+    (orbit1, orbittype1), (orbit2, orbittype2) = utils.read_orbits(
+        args.orbits, config["orbits"], context=context
     )
 
-    (orbit2, orbittype2) = utils.read_orbit(
-        orbit_name=args.orbits[1], config=config["orbits"], context=context
-    )
     # start, stop, and step
     start_date, stop_date, step = utils.start_stop_step(args, config, orbit1.getDate())
 
@@ -146,6 +149,8 @@ def execute(args=None) -> int:
     )
 
     if args.summary:
+        import astropy.units as u
+
         max_error = data.max(numeric_only=True).drop(labels="date_secs")
         max_error = max_error.apply(lambda x: u.Quantity(x, u.km))
         print(max_error)
@@ -155,8 +160,13 @@ def execute(args=None) -> int:
         if not fname.endswith(f".{args.format}"):
             fname = f"{fname}.{args.format}"
 
-        data.to_csv(fname, encoding="utf-8")
+        if args.format == "parquet":
+            utils.write_parquet(data, fname)
+        else:
+            utils.write_csv(data, fname)
 
     if args.display:
+        import matplotlib.pyplot as plt
+
         data.plot(x="date_secs", y=["radial_err", "in_track_err", "cross_track_err"])
         plt.show()
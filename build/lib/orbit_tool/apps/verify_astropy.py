@@ -1,25 +1,47 @@
 """Check astropy's GCRF -> ITRF transformations."""
+from datetime import timedelta
 import logging
+import numpy as np
 import orekitfactory.factory
+import typing
 
 import orbit_tool.utils as utils
 
-import pandas
-
 from org.orekit.data import DataContext
 from org.orekit.orbits import OrbitType
 from org.orekit.time import AbsoluteDate
 
-import astropy.coordinates
-import astropy.time
-import astropy.units
-
 from ..configuration import get_config
 
+if typing.TYPE_CHECKING:
+    import pandas
+
 SUBCOMMAND = "check-astropy"
 ALIASES = ["verify", "check", "va", "ca"]
 LOGGER_NAME = "orbit_tool"
 
+_ROW_DTYPE = np.dtype(
+    [
+        (name, np.float64)
+        for name in (
+            "j2000_sec",
+            "gcrf_x",
+            "gcrf_y",
+            "gcrf_z",
+            "gcrf_dx",
+            "gcrf_dy",
+            "gcrf_dz",
+            "itrf_x",
+            "itrf_y",
+            "itrf_z",
+            "itrf_dx",
+            "itrf_dy",
+            "itrf_dz",
+        )
+    ]
+)
+"""Numeric columns of the sampled states; positions in m, velocities in m/s."""
+
 
 def execute(args=None) -> int:
     logger = logging.getLogger(__name__)
@@ -37,51 +59,56 @@ def execute(args=None) -> int:
     df["itrf_diff_dy"] = df["itrf_dy"] - df["itrs_dy"]
     df["itrf_diff_dz"] = df["itrf_dz"] - df["itrs_dz"]
 
-    diff_itrf_pos = astropy.coordinates.CartesianRepresentation(
-        x=df["itrf_diff_x"], y=df["itrf_diff_y"], z=df["itrf_diff_z"]
+    df["delta_itrf_pos"], df["delta_itrf_vel"] = utils.pos_vel_norms(
+        df[["itrf_x", "itrf_y", "itrf_z"]].to_numpy(),
+        df[["itrf_dx", "itrf_dy", "itrf_dz"]].to_numpy(),
+        df[["itrs_x", "itrs_y", "itrs_z"]].to_numpy(),
+        df[["itrs_dx", "itrs_dy", "itrs_dz"]].to_numpy(),
     )
 
-    diff_itrf_vel = astropy.coordinates.CartesianRepresentation(
-        x=df["itrf_diff_dx"], y=df["itrf_diff_dy"], z=df["itrf_diff_dz"]
-    )
-
-    df["delta_itrf_pos"] = diff_itrf_pos.norm().value
-    df["delta_itrf_vel"] = diff_itrf_vel.norm().value
-
     print(df[["delta_itrf_pos", "delta_itrf_vel"]].describe())
 
 
-def add_astropy_cols(df: pandas.DataFrame):
+def add_astropy_cols(df: "pandas.DataFrame"):
+    import astropy.coordinates
+    import astropy.time
+    import astropy.units
+
     j2000 = astropy.time.Time("2000-01-01T12:00:00", format="isot", scale="tt")
     time = j2000.tai + astropy.time.TimeDelta(
         df["j2000_sec"], format="sec", scale="tai"
     )
 
+    m = astropy.units.m
+    m_per_s = astropy.units.m / astropy.units.s
+
     posvel = astropy.coordinates.CartesianRepresentation(
-        x=df["gcrf_x"],
-        y=df["gcrf_y"],
-        z=df["gcrf_z"],
-        unit=astropy.units.m,
+        x=df["gcrf_x"].values,
+        y=df["gcrf_y"].values,
+        z=df["gcrf_z"].values,
+        unit=m,
         differentials=astropy.coordinates.CartesianDifferential(
-            d_x=df["gcrf_dx"],
-            d_y=df["gcrf_dy"],
-            d_z=df["gcrf_dz"],
-            unit=astropy.units.m / astropy.units.s,
+            d_x=df["gcrf_dx"].values,
+            d_y=df["gcrf_dy"].values,
+            d_z=df["gcrf_dz"].values,
+            unit=m_per_s,
         ),
     )
 
     gcrs = astropy.coordinates.GCRS(posvel, obstime=time)
     itrs = gcrs.transform_to(astropy.coordinates.ITRS(obstime=time))
 
-    df["itrs_x"] = list(itrs.x)
-    df["itrs_y"] = list(itrs.y)
-    df["itrs_z"] = list(itrs.z)
-    df["itrs_dx"] = list(itrs.v_x)
-    df["itrs_dy"] = list(itrs.v_y)
-    df["itrs_dz"] = list(itrs.v_z)
+    # store plain floats, in the same units as the orekit columns
+    df["itrs_x"] = np.asarray(itrs.x.to_value(m))
+    df["itrs_y"] = np.asarray(itrs.y.to_value(m))
+    df["itrs_z"] = np.asarray(itrs.z.to_value(m))
+    df["itrs_dx"] = np.asarray(itrs.v_x.to_value(m_per_s))
+    df["itrs_dy"] = np.asarray(itrs.v_y.to_value(m_per_s))
+    df["itrs_dz"] = np.asarray(itrs.v_z.to_value(m_per_s))
 
 
-def build_data_frame(config: dict, context: DataContext) -> pandas.DataFrame:
+def build_data_frame(config: dict, context: DataContext) -> "pandas.DataFrame":
+    import pandas
 
     # load a consistent earth model
     earth = orekitfactory.factory.get_reference_ellipsoid(
@@ -98,65 +125,41 @@ def build_data_frame(config: dict, context: DataContext) -> pandas.DataFrame:
         **config["propagator_args"],
     )
 
+    # sample every 10 minutes over a day
     start: AbsoluteDate = orbit.getDate()
-    isodate = []
-    j2000_sec = []
-    gcrf_x = []
-    gcrf_y = []
-    gcrf_z = []
-    gcrf_dx = []
-    gcrf_dy = []
-    gcrf_dz = []
-    itrf_x = []
-    itrf_y = []
-    itrf_z = []
-    itrf_dx = []
-    itrf_dy = []
-    itrf_dz = []
+    step = timedelta(minutes=10)
+    stop = start.shiftedBy((timedelta(days=1) - step).total_seconds())
+    count = utils.sample_count(start, stop, step)
+
+    isodate = [None] * count
+    rows = np.empty(count, dtype=_ROW_DTYPE)
 
     orekit_gcrf = context.getFrames().getGCRF()
     orekit_itrf = orekitfactory.factory.get_frame(
         "itrf", context=context, simpleEop=False, iersConventions="2010"
     )
 
-    for dt in range(0, 86400, 600):
-        date = start.shiftedBy(float(dt))
-        state = propagator.propagate(date)
+    j2000_epoch = AbsoluteDate.J2000_EPOCH
+
+    # positions in m, velocities in m/s
+    def store_state(i: int, state):
+        date = state.getDate()
         pv_gcrf = state.getPVCoordinates(orekit_gcrf)
         pv_itrf = state.getPVCoordinates(orekit_itrf)
 
-        isodate.append(str(date.toString()))
-        j2000_sec.append(date.durationFrom(AbsoluteDate.J2000_EPOCH))
-
-        gcrf_x.append(pv_gcrf.getPosition().getX() * astropy.units.m)
-        gcrf_y.append(pv_gcrf.getPosition().getY() * astropy.units.m)
-        gcrf_z.append(pv_gcrf.getPosition().getZ() * astropy.units.m)
-        gcrf_dx.append(pv_gcrf.getVelocity().getX() * astropy.units.m / astropy.units.s)
-        gcrf_dy.append(pv_gcrf.getVelocity().getY() * astropy.units.m / astropy.units.s)
-        gcrf_dz.append(pv_gcrf.getVelocity().getZ() * astropy.units.m / astropy.units.s)
-
-        itrf_x.append(pv_itrf.getPosition().getX() * astropy.units.m)
-        itrf_y.append(pv_itrf.getPosition().getY() * astropy.units.m)
-        itrf_z.append(pv_itrf.getPosition().getZ() * astropy.units.m)
-        itrf_dx.append(pv_itrf.getVelocity().getX() * astropy.units.m / astropy.units.s)
-        itrf_dy.append(pv_itrf.getVelocity().getY() * astropy.units.m / astropy.units.s)
-        itrf_dz.append(pv_itrf.getVelocity().getZ() * astropy.units.m / astropy.units.s)
-
-    return pandas.DataFrame(
-        {
-            "isodate": isodate,
-            "j2000_sec": j2000_sec,
-            "gcrf_x": gcrf_x,
-            "gcrf_y": gcrf_y,
-            "gcrf_z": gcrf_z,
-            "gcrf_dx": gcrf_dx,
-            "gcrf_dy": gcrf_dy,
-            "gcrf_dz": gcrf_dz,
-            "itrf_x": itrf_x,
-            "itrf_y": itrf_y,
-            "itrf_z": itrf_z,
-            "itrf_dx": itrf_dx,
-            "itrf_dy": itrf_dy,
-            "itrf_dz": itrf_dz,
-        }
-    )
+        isodate[i] = str(date.toString())
+
+        # one jvm crossing per vector, rather than one per component
+        rows[i] = (
+            date.durationFrom(j2000_epoch),
+            *pv_gcrf.getPosition().toArray(),
+            *pv_gcrf.getVelocity().toArray(),
+            *pv_itrf.getPosition().toArray(),
+            *pv_itrf.getVelocity().toArray(),
+        )
+
+    n = utils.sample_states(propagator, start, stop, step, store_state)
+
+    df = pandas.DataFrame.from_records(rows[:n])
+    df.insert(0, "isodate", isodate[:n])
+    return df
@@ -1,8 +1,15 @@
 """Load the configuration."""
 import argparse
+import functools
 import logging
+import os.path
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 config = {}
 """Global configuration."""
 
@@ -33,16 +40,82 @@ def load_config(args: argparse.Namespace):
     logger = logging.getLogger(__name__)
     if "config" in args:
         try:
-            with open(args.config, "r") as file:
-                config = yaml.safe_load(file)
-                logger.info("Loaded configuration file path=%s", args.config)
+            loaded = _load_config_cached(args.config, os.path.getmtime(args.config))
+            logger.info("Loaded configuration file path=%s", args.config)
         except:
             logger.warn("Failed to load configuration path=%s", args.config, exc_info=1)
             config = {}
+        else:
+            config = normalize_config(loaded)
     else:
         logger.warn("No configuration file found in command line arguments.")
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime: float) -> dict:
+    """Parse the configuration file, caching the result per path and modification time.
+
+    Args:
+        path (str): Path to the configuration yaml file.
+        mtime (float): The file's modification time, used to invalidate the cache.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    with open(path, "r") as file:
+        return yaml.load(file, Loader=_Loader)
+
+
+def normalize_config(config: dict) -> dict:
+    """Convert the configured orbit thresholds to plain floats, once at load time.
+
+    The equatorial threshold, configured as an angle quantity in degrees, is stored
+    in radians as `equatoral_threshold_rad`, both at the top level and in the
+    `orbits` section, so readers compare against it directly. A section whose
+    thresholds cannot be parsed is left as configured.
+
+    Args:
+        config (dict): The loaded configuration. It is not modified.
+
+    Returns:
+        dict: A copy of the configuration, with the normalized thresholds.
+    """
+    import astropy.units as u
+    from orekitfactory.utils import validate_quantity
+
+    if not isinstance(config, dict):
+        return config
+
+    # copy, leaving the cached parse result untouched
+    config = dict(config)
+    if isinstance(config.get("orbits"), dict):
+        config["orbits"] = dict(config["orbits"])
+
+    for section in (config, config.get("orbits")):
+        if not isinstance(section, dict) or "equatoral_threshold_rad" in section:
+            continue
+
+        try:
+            circular = float(section.get("circular_threshold", 1.0e-3))
+            equatoral = float(
+                validate_quantity(
+                    section.get("equatoral_threshold", 0.001), u.deg
+                ).to_value(u.rad)
+            )
+        except Exception:
+            logging.getLogger(__name__).warning(
+                "Invalid orbit classification thresholds, leaving them unparsed.",
+                exc_info=1,
+            )
+            continue
+
+        if "circular_threshold" in section:
+            section["circular_threshold"] = circular
+        section["equatoral_threshold_rad"] = equatoral
+
+    return config
+
+
 def get_config() -> dict:
     global config
     return config
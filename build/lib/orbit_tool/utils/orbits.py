@@ -1,4 +1,4 @@
-import astropy.units as u
+import math
 from org.orekit.orbits import (
     Orbit,
     KeplerianOrbit,
@@ -6,79 +6,105 @@ from org.orekit.orbits import (
     EquinoctialOrbit,
 )
 from org.orekit.propagation.analytical.tle import TLE
-from org.hipparchus.util import MathUtils, FastMath
 
-from orekitfactory.utils import validate_quantity
-from .orbit_reader import OrbitType
+from .orbit_reader import OrbitType, _thresholds
+
+_AUTO_TYPES = {
+    KeplerianOrbit: OrbitType.KEPLERIAN,
+    CircularOrbit: OrbitType.CIRCULAR,
+    EquinoctialOrbit: OrbitType.EQUINOCTIAL,
+}
+"""Orbit type selected for orbits already of a known orbit class."""
+
+_TWO_PI = 2.0 * math.pi
+"""Radians per turn."""
+
+_RAD2DEG = 180.0 / math.pi
+"""Degrees per radian."""
+
+_M2KM = 1.0e-3
+"""Kilometers per meter."""
 
 
 def orbit_to_dict(orbit: TLE | Orbit, dest_type: OrbitType, config: dict) -> dict:
     if isinstance(orbit, TLE):
         return {"line1": orbit.getLine1(), "line2": orbit.getLine2()}
     elif isinstance(orbit, Orbit):
-
         if dest_type is OrbitType.AUTO_SELECT:
-            if isinstance(orbit, KeplerianOrbit):
-                dest_type = OrbitType.KEPLERIAN
-            elif isinstance(orbit, CircularOrbit):
-                dest_type = OrbitType.CIRCULAR
-            elif isinstance(orbit, EquinoctialOrbit):
-                dest_type = OrbitType.EQUINOCTIAL
-            else:
-                orbit = KeplerianOrbit(orbit)
-                circular_threshold = float(config.get("circular_threshold", 1.0e-3))
-                equatoral_threshold = validate_quantity(
-                    config.get("equatoral_threshold", 0.001), u.deg
-                )
-
-                circular = orbit.getE() < circular_threshold
-                equatoral = orbit.getI() < float(equatoral_threshold.to_value(u.rad))
-
-                if circular and not equatoral:
-                    dest_type = OrbitType.CIRCULAR
-                elif circular or equatoral:
-                    dest_type = OrbitType.EQUINOCTIAL
-                else:
-                    dest_type = OrbitType.KEPLERIAN
-
-        if dest_type is OrbitType.KEPLERIAN:
-            orbit = KeplerianOrbit(orbit)
-            return {
-                "a": u.Quantity(orbit.getA(), u.m).to_string(u.km),
-                "e": orbit.getE(),
-                "i": u.Quantity(orbit.getI(), u.rad).to_string(u.deg),
-                "w": u.Quantity(orbit.getPerigeeArgument(), u.rad).to_string(u.deg),
-                "omega": u.Quantity(
-                    MathUtils.normalizeAngle(
-                        orbit.getRightAscensionOfAscendingNode(), FastMath.PI
-                    ),
-                    u.rad,
-                ).to_string(u.deg),
-                "v": u.Quantity(
-                    MathUtils.normalizeAngle(orbit.getTrueAnomaly(), FastMath.PI), u.rad
-                ).to_string(u.deg),
-                "m": u.Quantity(
-                    MathUtils.normalizeAngle(orbit.getMeanAnomaly(), FastMath.PI), u.rad
-                ).to_string(u.deg),
-            }
-        elif dest_type is OrbitType.CIRCULAR:
-            orbit = CircularOrbit(orbit)
-            return {
-                "a": u.Quantity(orbit.getA(), u.m).to_string(u.km),
-                "ex": orbit.getCircularEx(),
-                "ey": orbit.getCircularEy(),
-                "i": u.Quantity(orbit.getI(), u.rad).to_string(u.deg),
-                "omega": u.Quantity(
-                    MathUtils.normalizeAngle(
-                        orbit.getRightAscensionOfAscendingNode(), FastMath.PI
-                    ),
-                    u.rad,
-                ).to_string(u.deg),
-                "alphaV": u.Quantity(
-                    MathUtils.normalizeAngle(orbit.getAlphaV(), FastMath.PI), u.rad
-                ).to_string(u.deg),
-            }
+            dest_type = _AUTO_TYPES.get(type(orbit)) or _select_type(orbit, config)
+
+        handler = _HANDLERS.get(dest_type)
+        if handler is not None:
+            return handler(orbit)
 
     raise ValueError(
         f"Cannot convert orbit {str(orbit)} to destination type {dest_type}."
     )
+
+
+def _select_type(orbit: Orbit, config: dict) -> OrbitType:
+    # every orbit provides e and i, no keplerian conversion needed to classify it
+    circular_threshold, equatoral_threshold = _thresholds(config)
+
+    circular = orbit.getE() < circular_threshold
+    equatoral = orbit.getI() < equatoral_threshold
+
+    if circular and not equatoral:
+        return OrbitType.CIRCULAR
+    elif circular or equatoral:
+        return OrbitType.EQUINOCTIAL
+    else:
+        return OrbitType.KEPLERIAN
+
+
+def _keplerian_dict(orbit: Orbit) -> dict:
+    if not isinstance(orbit, KeplerianOrbit):
+        orbit = KeplerianOrbit(orbit)
+    return {
+        "a": _km_str(orbit.getA()),
+        "e": orbit.getE(),
+        "i": _deg_str(orbit.getI()),
+        "w": _deg_str(orbit.getPerigeeArgument()),
+        "omega": _deg_str(
+            _normalize_angle(orbit.getRightAscensionOfAscendingNode(), math.pi)
+        ),
+        "v": _deg_str(_normalize_angle(orbit.getTrueAnomaly(), math.pi)),
+        "m": _deg_str(_normalize_angle(orbit.getMeanAnomaly(), math.pi)),
+    }
+
+
+def _circular_dict(orbit: Orbit) -> dict:
+    if not isinstance(orbit, CircularOrbit):
+        orbit = CircularOrbit(orbit)
+    return {
+        "a": _km_str(orbit.getA()),
+        "ex": orbit.getCircularEx(),
+        "ey": orbit.getCircularEy(),
+        "i": _deg_str(orbit.getI()),
+        "omega": _deg_str(
+            _normalize_angle(orbit.getRightAscensionOfAscendingNode(), math.pi)
+        ),
+        "alphaV": _deg_str(_normalize_angle(orbit.getAlphaV(), math.pi)),
+    }
+
+
+def _normalize_angle(a: float, center: float) -> float:
+    """Normalize an angle to [center - pi, center + pi), as MathUtils.normalizeAngle."""
+    return a - _TWO_PI * math.floor((a + math.pi - center) / _TWO_PI)
+
+
+def _deg_str(rad: float) -> str:
+    """Format an angle in radians as a degree quantity string, e.g. "90.0 deg"."""
+    return f"{rad * _RAD2DEG} deg"
+
+
+def _km_str(m: float) -> str:
+    """Format a length in meters as a kilometer quantity string, e.g. "7000.0 km"."""
+    return f"{m * _M2KM} km"
+
+
+_HANDLERS = {
+    OrbitType.KEPLERIAN: _keplerian_dict,
+    OrbitType.CIRCULAR: _circular_dict,
+}
+"""Dictionary builders, by destination orbit type."""
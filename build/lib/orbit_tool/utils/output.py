@@ -0,0 +1,47 @@
+"""Write result tables to disk, using pyarrow when it is installed."""
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas
+
+
+def write_csv(data: "pandas.DataFrame", fname: str):
+    """Write a data frame as csv.
+
+    Uses pyarrow's native csv writer when it is installed, falling back to pandas.
+
+    Args:
+        data (pandas.DataFrame): The data to write.
+        fname (str): The output file path.
+    """
+    try:
+        import pyarrow
+        import pyarrow.csv
+    except ImportError:
+        # full float precision, as written by pyarrow
+        data.to_csv(fname, encoding="utf-8", index=False, chunksize=65536)
+        return
+
+    # wrap the numpy column buffers directly, skipping the pandas conversion layer
+    table = pyarrow.table({name: data[name].to_numpy() for name in data.columns})
+    pyarrow.csv.write_csv(table, fname)
+
+
+def write_parquet(data: "pandas.DataFrame", fname: str):
+    """Write a data frame as parquet.
+
+    Uses pyarrow when it is installed, falling back to pandas' parquet engines.
+
+    Args:
+        data (pandas.DataFrame): The data to write.
+        fname (str): The output file path.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        data.to_parquet(fname, index=False)
+        return
+
+    table = pyarrow.table({name: data[name].to_numpy() for name in data.columns})
+    pyarrow.parquet.write_table(table, fname)
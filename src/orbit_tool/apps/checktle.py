@@ -1,22 +1,35 @@
 """Verify a TLE's accuracy over time against a high fidelity propatator."""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import argparse
 import logging
+import orekit
 import orekitfactory.factory
-import astropy.units as u
-import matplotlib.pyplot as plt
+import numpy as np
 import time
+import typing
 
 from org.orekit.data import DataContext
-from org.orekit.frames import Frame, LOFType
+from org.orekit.frames import Frame
 from org.orekit.orbits import CartesianOrbit
 from org.orekit.propagation import Propagator
 from org.orekit.time import AbsoluteDate
 
 from ..configuration import get_config
-from ..utils import read_orbit, OrbitType, to_timedelta, start_stop_step
+from ..utils import (
+    read_orbit,
+    OrbitType,
+    to_timedelta,
+    start_stop_step,
+    sample_count,
+    qsw_errors,
+    write_csv,
+)
 
-from pandas import DataFrame
+from orekit.pyhelpers import absolutedate_to_datetime
+
+if typing.TYPE_CHECKING:
+    import pandas
 
 
 ALIASES = ["check", "chk"]
@@ -155,6 +168,8 @@ def execute(args=None) -> int:
     )
 
     if args.summary:
+        import astropy.units as u
+
         max_error = data.max(numeric_only=True).drop(labels="date_secs")
         max_error = max_error.apply(lambda x: u.Quantity(x, u.km))
         print(max_error)
@@ -164,9 +179,11 @@ def execute(args=None) -> int:
         if not fname.endswith(f".{args.format}"):
             fname = f"{fname}.{args.format}"
 
-        data.to_csv(fname, encoding="utf-8")
+        write_csv(data, fname)
 
     if args.display:
+        import matplotlib.pyplot as plt
+
         data.plot(x="date_secs", y=["radial_err", "in_track_err", "cross_track_err"])
         plt.show()
 
@@ -178,7 +195,10 @@ def compare_propagators(
     stop: AbsoluteDate,
     step: timedelta,
     frame: Frame,
-) -> DataFrame:
+    parallel: bool = True,
+) -> "pandas.DataFrame":
+    import pandas
+
     logger = logging.getLogger(__name__)
 
     logger.info(
@@ -187,41 +207,34 @@ def compare_propagators(
         str(stop),
         str(step),
     )
-    dates = []
-    date_secs = []
-    in_track_err = []
-    cross_track_err = []
-    radial_err = []
-
     if step <= timedelta():
         raise RuntimeError("Invalid step. Durations must be greater than zero.")
 
-    t = start
     step_secs = step.total_seconds()
-    count = 0
-    perf_t0 = time.perf_counter_ns()
-    while t.isBeforeOrEqualTo(stop):
-        if 0 == count % 100:
-            logger.debug("evaluating for t=%s", str(t))
-
-        base_state = base.propagate(t)
-        check_state = check.propagate(t)
-
-        base_pv = base_state.getPVCoordinates(frame)
-        check_pv = check_state.getPVCoordinates(frame)
-
-        tx_to_lof = LOFType.QSW.transformFromInertial(t, base_pv)
-
-        check_pv_lof = tx_to_lof.transformPVCoordinates(check_pv)
+    count = sample_count(start, stop, step)
 
-        dates.append(str(t))
-        date_secs.append(t.durationFrom(start))
-        radial_err.append(check_pv_lof.getPosition().getX() / 1000.0)
-        in_track_err.append(check_pv_lof.getPosition().getY() / 1000.0)
-        cross_track_err.append(check_pv_lof.getPosition().getZ() / 1000.0)
+    date_secs = np.arange(count, dtype=np.float64) * step_secs
+    base_pos = np.empty((count, 3), dtype=np.float64)
+    base_vel = np.empty((count, 3), dtype=np.float64)
+    check_pos = np.empty((count, 3), dtype=np.float64)
 
-        t = t.shiftedBy(step_secs)
-        count = count + 1
+    perf_t0 = time.perf_counter_ns()
+    jobs = [(base, base_pos, base_vel), (check, check_pos, None)]
+    if parallel and not base.equals(check):
+        # each propagator is only used by its own thread, and the jvm releases the gil
+        # while propagating, so the two samplings overlap
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [
+                executor.submit(
+                    _sample_pv_in_worker, p, start, date_secs, frame, pos, vel
+                )
+                for p, pos, vel in jobs
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for p, pos, vel in jobs:
+            _sample_pv(p, start, date_secs, frame, pos, vel)
     perf_t1 = time.perf_counter_ns()
 
     logger.info(
@@ -229,12 +242,68 @@ def compare_propagators(
         str(timedelta(seconds=(perf_t1 - perf_t0) * 1e-9)),
     )
 
-    return DataFrame.from_dict(
+    # errors in the base orbit's QSW frame, in km
+    err = qsw_errors(base_pos, base_vel, check_pos) / 1000.0
+
+    # derive the sample dates in bulk, rather than formatting each one in the loop
+    dates = pandas.Timestamp(absolutedate_to_datetime(start)) + pandas.to_timedelta(
+        date_secs, unit="s"
+    )
+
+    return pandas.DataFrame(
         {
             "dates": dates,
             "date_secs": date_secs,
-            "in_track_err": in_track_err,
-            "cross_track_err": cross_track_err,
-            "radial_err": radial_err,
+            "in_track_err": err[:, 1],
+            "cross_track_err": err[:, 2],
+            "radial_err": err[:, 0],
         }
     )
+
+
+def _sample_pv(
+    propagator: Propagator,
+    start: AbsoluteDate,
+    date_secs: np.ndarray,
+    frame: Frame,
+    pos: np.ndarray,
+    vel: np.ndarray = None,
+):
+    """Fill position (and optionally velocity) buffers from a propagator.
+
+    Args:
+        propagator (Propagator): The propagator to sample.
+        start (AbsoluteDate): The reference date of the samples.
+        date_secs (np.ndarray): The sample offsets, in seconds, from the start.
+        frame (Frame): The frame of the sampled coordinates.
+        pos (np.ndarray): The (N, 3) output positions.
+        vel (np.ndarray, optional): The (N, 3) output velocities. Defaults to None,
+        skipping the velocities.
+    """
+    logger = logging.getLogger(__name__)
+    for i in range(len(date_secs)):
+        t = start.shiftedBy(float(date_secs[i]))
+        if 0 == i % 100:
+            logger.debug("evaluating for t=%s", str(t))
+
+        pv = propagator.propagate(t).getPVCoordinates(frame)
+        pos[i] = pv.getPosition().toArray()
+        if vel is not None:
+            vel[i] = pv.getVelocity().toArray()
+
+
+def _sample_pv_in_worker(*args):
+    """Run `_sample_pv` on a worker thread, attached to the jvm for the call.
+
+    The thread is attached only when it is not already, and is then detached before
+    returning, so no attached thread outlives its executor.
+    """
+    env = orekit.getVMEnv()
+    attached = not env.isCurrentThreadAttached()
+    if attached:
+        env.attachCurrentThread()
+    try:
+        _sample_pv(*args)
+    finally:
+        if attached:
+            env.detachCurrentThread()
@@ -20,7 +20,14 @@ from org.orekit.propagation.conversion import (
 from org.orekit.time import AbsoluteDate
 
 from ..configuration import get_config
-from ..utils import read_orbit, OrbitType as OrbitTypeData, start_stop_step, orbit_to_dict
+from ..utils import (
+    read_orbit,
+    OrbitType as OrbitTypeData,
+    start_stop_step,
+    orbit_to_dict,
+    sample_count,
+    sample_states,
+)
 
 SUBCOMMAND = "convert-orbit"
 ALIASES = ["co"]
@@ -82,13 +89,11 @@ def generate_states(
         step,
     )
 
-    t = start_date
-    step_secs = step.total_seconds()
-
-    states = ArrayList()
-    while t.isBeforeOrEqualTo(stop_date):
-        states.add(propgator.propagate(t))
-        t = t.shiftedBy(step_secs)
+    # size the list up front, sample_states never exceeds sample_count
+    states = ArrayList(sample_count(start_date, stop_date, step))
+    sample_states(
+        propgator, start_date, stop_date, step, lambda i, state: states.add(state)
+    )
 
     logger.info("Completed propagation. Generated %d states", states.size())
 
@@ -1,12 +1,11 @@
 """Generate an HTML file, drawing the orbit around a cesium globe."""
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 import argparse
-import czml3
-import czml3.enums
-import czml3.properties
-import czml3.types
 import orekitfactory.factory
 import datetime
+import functools
+import json
+import numpy as np
 import orekitfactory.initializer
 
 import orbit_tool.utils as utils
@@ -29,10 +28,31 @@ from org.orekit.time import AbsoluteDate
 
 from ..configuration import get_config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import czml3
+    import czml3.properties
+    import czml3.types
+
 SUBCOMMAND = "draw-orbit"
 ALIASES = ["show-orbit", "show"]
 LOGGER_NAME = "orbit_tool"
 
+_BILLBOARD_IMAGE = (
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9"
+    "hAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdv"
+    "qGQAAADJSURBVDhPnZHRDcMgEEMZjVEYpaNklIzSEfLfD4qNnXAJSFWfhO7w2Zc0T"
+    "f9QG2rXrEzSUeZLOGm47WoH95x3Hl3jEgilvDgsOQUTqsNl68ezEwn1vae6lceSEE"
+    "YvvWNT/Rxc4CXQNGadho1NXoJ+9iaqc2xi2xbt23PJCDIB6TQjOC6Bho/sDy3fBQT"
+    "8PrVhibU7yBFcEPaRxOoeTwbwByCOYf9VGp1BYI1BA+EeHhmfzKbBoJEQwn1yzUZt"
+    "yspIQUha85MpkNIXB7GizqDEECsAAAAASUVORK5CYII="
+)
+"""Satellite icon used as the orbit billboard."""
+
 
 def config_args(parser):
     parser.add_argument(
@@ -70,30 +90,44 @@ def config_args(parser):
 
 def execute(args=None) -> int:
     """Generate the orbit html."""
+    import czml3
+    import czml3.properties
+    import czml3.types
+
     config = get_config()
-    packets, start, stop = generate_packet(args, config)
-
-    doc = czml3.Document(
-        [
-            czml3.Preamble(
-                name="orbit-tool-drawing",
-                clock=czml3.types.IntervalValue(
-                    start=start,
-                    end=stop,
-                    value=czml3.properties.Clock(currentTime=start, multiplier=10),
-                ),
-            ),
-            *packets,
-        ]
+    packets, carts, start, stop = generate_packet(args, config)
+
+    preamble = czml3.Preamble(
+        name="orbit-tool-drawing",
+        clock=czml3.types.IntervalValue(
+            start=start,
+            end=stop,
+            value=czml3.properties.Clock(currentTime=start, multiplier=10),
+        ),
     )
 
     with open(args.output_file, "w") as f:
-        doc.dump(f)
+        _dump_document(f, preamble, packets, carts, start)
 
 
 def generate_packet(
     args, config
-) -> tuple[list[czml3.Packet], datetime.datetime, datetime.datetime]:
+) -> "tuple[list[czml3.Packet], np.ndarray, datetime.datetime, datetime.datetime]":
+    """Generate the czml packets drawing the orbit.
+
+    The orbit's position samples are returned separately from the packets, so they
+    can be streamed to the output rather than embedded in the czml objects.
+
+    Returns:
+        tuple[list[czml3.Packet], np.ndarray, datetime.datetime, datetime.datetime]:
+        The packets (the first being the orbit, without its position), the
+        (N, 4) array of position samples, and the start and stop times.
+    """
+    import czml3
+    import czml3.enums
+    import czml3.properties
+    import czml3.types
+
     context = DataContext.getDefault()
 
     # load a consistent earth model
@@ -116,7 +150,8 @@ def generate_packet(
     start_dt = absolutedate_to_datetime(start_date)
     stop_dt = absolutedate_to_datetime(stop_date)
 
-    propagator.propagate(start_date)
+    if step <= datetime.timedelta():
+        raise RuntimeError("Invalid step. Durations must be greater than zero.")
 
     if args.events:
         detectors, handler = _generate_event_detector(
@@ -125,24 +160,17 @@ def generate_packet(
         for d in detectors:
             propagator.addEventDetector(d)
 
-    if step <= datetime.timedelta():
-        raise RuntimeError("Invalid step. Durations must be greater than zero.")
-
-    def generate_carts():
-        inertial = context.getFrames().getGCRF()
-        t: AbsoluteDate = start_date
-        step_secs: float = step.total_seconds()
-        while t.isBeforeOrEqualTo(stop_date):
-            state = propagator.propagate(t)
+    # sample the inertial position at each step, in a single propagation
+    inertial = context.getFrames().getGCRF()
+    count = utils.sample_count(start_date, stop_date, step)
+    carts = np.empty((count, 4), dtype=np.float64)
+    carts[:, 0] = np.arange(count, dtype=np.float64) * step.total_seconds()
 
-            pv = state.getPVCoordinates(inertial)
+    def store_position(i: int, state):
+        carts[i, 1:] = state.getPVCoordinates(inertial).getPosition().toArray()
 
-            yield t.durationFrom(start_date)
-            yield pv.getPosition().getX()
-            yield pv.getPosition().getY()
-            yield pv.getPosition().getZ()
-
-            t = t.shiftedBy(step_secs)
+    count = utils.sample_states(propagator, start_date, stop_date, step, store_position)
+    carts = carts[:count]
 
     name, label, bb = _generate_meta(args.orbit, config["orbits"])
     path = czml3.properties.Path(
@@ -156,14 +184,6 @@ def generate_packet(
         ),
     )
 
-    pos = czml3.properties.Position(
-        interpolationAlgorithm=czml3.enums.InterpolationAlgorithms.LAGRANGE,
-        interpolationDegree=3,
-        referenceFrame=czml3.enums.ReferenceFrames.INERTIAL,
-        epoch=start_dt,
-        cartesian=list(generate_carts()),
-    )
-
     packets = [
         czml3.Packet(
             id=args.orbit,
@@ -172,31 +192,20 @@ def generate_packet(
             billboard=bb,
             label=label,
             path=path,
-            position=pos,
         )
     ]
 
     if args.events:
+
+        def shift_dt(date: AbsoluteDate, secs: float) -> datetime.datetime:
+            return absolutedate_to_datetime(date.shiftedBy(secs))
+
         for date, event, pv in handler.results:
-            show = czml3.types.Sequence(
-                [
-                    czml3.types.IntervalValue(
-                        start=start_dt,
-                        end=absolutedate_to_datetime(date.shiftedBy(300.0)),
-                        value=False,
-                    ),
-                    czml3.types.IntervalValue(
-                        start=absolutedate_to_datetime(date.shiftedBy(-300.0)),
-                        end=absolutedate_to_datetime(date.shiftedBy(300.0)),
-                        value=True,
-                    ),
-                    czml3.types.IntervalValue(
-                        start=absolutedate_to_datetime(date.shiftedBy(300.0)),
-                        end=stop_dt,
-                        value=False,
-                    ),
-                ]
-            )
+            before = shift_dt(date, -300.0)
+            after = shift_dt(date, 300.0)
+            xyz = pv.getPosition().toArray()
+
+            show = _event_show(start_dt, stop_dt, before, after)
             packets.append(
                 czml3.Packet(
                     id=f"event_{date.toString()}",
@@ -204,34 +213,118 @@ def generate_packet(
                     label=czml3.properties.Label(
                         font="11pt Lucida Console",
                         text=event,
-                        fillColor=czml3.properties.Color.from_str("#00FF00"),
+                        fillColor=_color("#00FF00"),
                         style=czml3.enums.LabelStyles.FILL_AND_OUTLINE,
                         show=show,
                     ),
                     position=czml3.properties.Position(
-                        cartesian=[
-                            pv.getPosition().getX(),
-                            pv.getPosition().getY(),
-                            pv.getPosition().getZ(),
-                        ],
+                        cartesian=list(xyz),
                         referenceFrame=czml3.enums.ReferenceFrames.INERTIAL,
                     ),
                     point=czml3.properties.Point(
                         pixelSize=10,
-                        color=czml3.properties.Color.from_str("#00FF00"),
-                        outlineColor=czml3.properties.Color.from_str("#00FF00"),
+                        color=_color("#00FF00"),
+                        outlineColor=_color("#00FF00"),
                         outlineWidth=2,
                         show=show,
                     ),
                 )
             )
 
-    return packets, start_dt, stop_dt
+    return packets, carts, start_dt, stop_dt
+
+
+def _event_show(
+    start: datetime.datetime,
+    stop: datetime.datetime,
+    before: datetime.datetime,
+    after: datetime.datetime,
+) -> "czml3.types.Sequence":
+    """Build the visibility intervals of an event, shown only between before and after.
+
+    The hidden intervals preceding and following the event window are omitted when
+    they would be empty.
+    """
+    import czml3.types
+
+    intervals = []
+    if before > start:
+        intervals.append(
+            czml3.types.IntervalValue(start=start, end=before, value=False)
+        )
+    intervals.append(czml3.types.IntervalValue(start=before, end=after, value=True))
+    if after < stop:
+        intervals.append(czml3.types.IntervalValue(start=after, end=stop, value=False))
+    return czml3.types.Sequence(intervals)
+
+
+def _dump_document(
+    f,
+    preamble: "czml3.Preamble",
+    packets: "list[czml3.Packet]",
+    carts: np.ndarray,
+    epoch: datetime.datetime,
+    chunk_rows: int = 1024,
+):
+    """Write the czml document incrementally.
+
+    Each packet is serialized on its own, and the orbit position samples are written
+    in chunks, so the full document is never held in memory as a single string.
+
+    Args:
+        f: The writable text file.
+        preamble (czml3.Preamble): The document preamble.
+        packets (list[czml3.Packet]): The packets, the first being the orbit packet.
+        carts (np.ndarray): The (N, 4) array of orbit position samples.
+        epoch (datetime.datetime): The epoch of the position samples.
+        chunk_rows (int, optional): Number of samples written per chunk. Defaults
+        to 1024.
+    """
+    import czml3.enums
+    import czml3.types
+
+    f.write("[\n")
+    f.write(preamble.dumps())
+    for n, packet in enumerate(packets):
+        f.write(",\n")
+        body = packet.dumps()
+        if n > 0:
+            f.write(body)
+            continue
+
+        # splice the streamed position into the orbit packet
+        f.write(body[: body.rindex("}")])
+        position = json.dumps(
+            {
+                "epoch": czml3.types.format_datetime_like(epoch),
+                "interpolationAlgorithm": (
+                    czml3.enums.InterpolationAlgorithms.LAGRANGE.name
+                ),
+                "interpolationDegree": 3,
+                "referenceFrame": czml3.enums.ReferenceFrames.INERTIAL.name,
+            }
+        )
+        f.write(', "position": ')
+        f.write(position[:-1])
+        f.write(', "cartesian": [')
+        for i in range(0, len(carts), chunk_rows):
+            if i > 0:
+                f.write(",")
+            f.write(_format_floats(carts[i : i + chunk_rows].ravel()))
+        f.write("]}}")
+    f.write("\n]\n")
+
+
+def _format_floats(values: np.ndarray) -> str:
+    """Format an array of floats as the comma-separated body of a json array."""
+    if orjson is not None:
+        return orjson.dumps(values, option=orjson.OPT_SERIALIZE_NUMPY)[1:-1].decode()
+    return ",".join(map(repr, values.tolist()))
 
 
 def _generate_meta(
     orbit_id: str, config: dict
-) -> tuple[str, czml3.properties.Label, czml3.properties.Billboard]:
+) -> "tuple[str, czml3.properties.Label, czml3.properties.Billboard]":
     default_config = config
     orbit_config = config[orbit_id]
 
@@ -239,37 +332,60 @@ def _generate_meta(
 
     name = orbit_config.get("name", orbit_id)
 
+    label, bb = _label_and_billboard(
+        name,
+        defaults("fillColor", "#00FF00"),
+        defaults("outlineColor", "#000000"),
+        defaults("font", "11pt Lucida Console"),
+        defaults("outlineWidth", 2),
+        defaults("scale", 1.5),
+    )
+
+    return name, label, bb
+
+
+@functools.lru_cache(maxsize=64)
+def _color(value: str) -> "czml3.properties.Color":
+    """Parse a color string, caching the result."""
+    import czml3.properties
+
+    return czml3.properties.Color.from_str(value)
+
+
+@functools.lru_cache(maxsize=32)
+def _label_and_billboard(
+    name: str,
+    fill_color: str,
+    outline_color: str,
+    font: str,
+    outline_width: int,
+    scale: float,
+) -> "tuple[czml3.properties.Label, czml3.properties.Billboard]":
+    """Build the (immutable) label and billboard for an orbit, caching the result."""
+    import czml3.enums
+    import czml3.properties
+
     label = czml3.properties.Label(
         horizontalOrigin=czml3.enums.HorizontalOrigins.LEFT,
-        outlineWidth=defaults("outlineWidth", 2),
+        outlineWidth=outline_width,
         show=True,
-        font=defaults("font", "11pt Lucida Console"),
+        font=font,
         style=czml3.enums.LabelStyles.FILL_AND_OUTLINE,
         text=name,
         verticalOrigin=czml3.enums.VerticalOrigins.CENTER,
-        fillColor=czml3.properties.Color.from_str(defaults("fillColor", "#00FF00")),
-        outlineColor=czml3.properties.Color.from_str(
-            defaults("outlineColor", "#000000")
-        ),
+        fillColor=_color(fill_color),
+        outlineColor=_color(outline_color),
     )
 
     bb = czml3.properties.Billboard(
         horizontalOrigin=czml3.enums.HorizontalOrigins.CENTER,
-        image=(
-            "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9"
-            "hAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdv"
-            "qGQAAADJSURBVDhPnZHRDcMgEEMZjVEYpaNklIzSEfLfD4qNnXAJSFWfhO7w2Zc0T"
-            "f9QG2rXrEzSUeZLOGm47WoH95x3Hl3jEgilvDgsOQUTqsNl68ezEwn1vae6lceSEE"
-            "YvvWNT/Rxc4CXQNGadho1NXoJ+9iaqc2xi2xbt23PJCDIB6TQjOC6Bho/sDy3fBQT"
-            "8PrVhibU7yBFcEPaRxOoeTwbwByCOYf9VGp1BYI1BA+EeHhmfzKbBoJEQwn1yzUZt"
-            "yspIQUha85MpkNIXB7GizqDEECsAAAAASUVORK5CYII="
-        ),
-        scale=defaults("scale", 1.5),
+        image=_BILLBOARD_IMAGE,
+        scale=scale,
         show=True,
         verticalOrigin=czml3.enums.VerticalOrigins.CENTER,
     )
 
-    return name, label, bb
+    return label, bb
 
 
 class OrbitEventHandler(PythonEventHandler):
@@ -331,8 +447,8 @@ class OrbitEventHandler(PythonEventHandler):
 
 def _generate_event_detector(
     orbit: Orbit | TLE = None,
-    max_check: datetime.timedelta | float = datetime.timedelta(seconds=600),
-    threshold: datetime.timedelta | float = datetime.timedelta(microseconds=1),
+    max_check: datetime.timedelta | float = 600.0,
+    threshold: datetime.timedelta | float = 1.0e-6,
     body: OneAxisEllipsoid = None,
     context: DataContext = None,
 ) -> tuple[tuple[EventDetector], OrbitEventHandler]:
@@ -341,8 +457,8 @@ def _generate_event_detector(
     Args:
         type (OrbitEventTypeData): The type of event marking crossings.
         orbit (Orbit|TLE, optional): The orbit definition. Required when looking for ASCENDING or DESCENDING events. Defaults to None.
-        max_check (dt.timedelta | float): The maximal checking interval. `float` values will be interpreted as seconds.
-        threshold (dt.timedelta | float): The convergence threshold. `float` values will be interpreted as seconds.
+        max_check (dt.timedelta | float): The maximal checking interval. `float` values will be interpreted as seconds. Defaults to 600 seconds.
+        threshold (dt.timedelta | float): The convergence threshold. `float` values will be interpreted as seconds. Defaults to 1 microsecond.
         body (OneAxisEllipsoid, optional): The central body around which the satellite orbits. Defaults to None.
         context (DataContext, optional): The context to use. If not provided, the default will be
         used. Defaults to None.
@@ -350,22 +466,22 @@ def _generate_event_detector(
     Raises:
         ValueError: When an invalid type is provided.
     """
-    if isinstance(max_check, (int, float)):
-        max_check = datetime.timedelta(seconds=max_check)
-    if isinstance(threshold, (int, float)):
-        threshold = datetime.timedelta(seconds=threshold)
+    if isinstance(max_check, datetime.timedelta):
+        max_check = max_check.total_seconds()
+    if isinstance(threshold, datetime.timedelta):
+        threshold = threshold.total_seconds()
 
     if body is None:
         body = orekitfactory.factory.get_reference_ellipsoid(context)
 
     asc_desc_detector = (
         NodeDetector(body.getBodyFrame())
-        .withThreshold(threshold.total_seconds())
-        .withMaxCheck(max_check.total_seconds())
+        .withThreshold(float(threshold))
+        .withMaxCheck(float(max_check))
     )
     north_south_detector = LatitudeExtremumDetector(
-        max_check.total_seconds(),
-        threshold.total_seconds(),
+        float(max_check),
+        float(threshold),
         OneAxisEllipsoid.cast_(body),
     )
 
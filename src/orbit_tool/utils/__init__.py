@@ -1,4 +1,7 @@
 """Python package."""
-from .orbit_reader import read_orbit, OrbitType
-from .duration import to_timedelta, start_stop_step
+from .orbit_reader import read_orbit, read_orbits, prefetch_tles, OrbitType
+from .duration import to_timedelta, start_stop_step, sample_count
 from .orbits import orbit_to_dict
+from .sampling import sample_states
+from ._fastmath import qsw_errors, pos_vel_norms
+from .output import write_csv, write_parquet
@@ -0,0 +1,159 @@
+"""Numeric kernels, compiled with numba when it is installed."""
+import functools
+
+import numpy as np
+
+# replaced by numba.prange when the kernels are compiled
+prange = range
+
+
+@functools.lru_cache(maxsize=None)
+def _kernels():
+    """Build the kernels on first use, so importing this module stays cheap."""
+    try:
+        import numba
+    except ImportError:
+        return _qsw_errors_numpy, _pos_vel_norms_numpy
+
+    # numba resolves globals when compiling, so the loops pick up its prange
+    global prange
+    prange = numba.prange
+
+    jit = numba.njit(parallel=True, fastmath=True, cache=True)
+    return jit(_qsw_errors_loop), jit(_pos_vel_norms_loop)
+
+
+def qsw_errors(
+    base_pos: np.ndarray, base_vel: np.ndarray, check_pos: np.ndarray
+) -> np.ndarray:
+    """Compute position errors in the QSW local orbital frame of a base orbit.
+
+    Args:
+        base_pos (np.ndarray): The (N, 3) inertial positions of the base orbit.
+        base_vel (np.ndarray): The (N, 3) inertial velocities of the base orbit.
+        check_pos (np.ndarray): The (N, 3) inertial positions being checked.
+
+    Returns:
+        np.ndarray: The (N, 3) radial, in-track and cross-track errors of
+        ``check_pos`` relative to ``base_pos``, in the input units.
+    """
+    return _kernels()[0](
+        np.ascontiguousarray(base_pos, dtype=np.float64),
+        np.ascontiguousarray(base_vel, dtype=np.float64),
+        np.ascontiguousarray(check_pos, dtype=np.float64),
+    )
+
+
+def pos_vel_norms(
+    ref_pos: np.ndarray,
+    ref_vel: np.ndarray,
+    check_pos: np.ndarray,
+    check_vel: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the magnitudes of the position and velocity differences.
+
+    Args:
+        ref_pos (np.ndarray): The (N, 3) reference positions.
+        ref_vel (np.ndarray): The (N, 3) reference velocities.
+        check_pos (np.ndarray): The (N, 3) positions being checked.
+        check_vel (np.ndarray): The (N, 3) velocities being checked.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (N,) norms of ``ref_pos - check_pos`` and
+        ``ref_vel - check_vel``, in the input units.
+    """
+    return _kernels()[1](
+        np.ascontiguousarray(ref_pos, dtype=np.float64),
+        np.ascontiguousarray(ref_vel, dtype=np.float64),
+        np.ascontiguousarray(check_pos, dtype=np.float64),
+        np.ascontiguousarray(check_vel, dtype=np.float64),
+    )
+
+
+def _qsw_errors_loop(
+    base_pos: np.ndarray, base_vel: np.ndarray, check_pos: np.ndarray
+) -> np.ndarray:
+    n = base_pos.shape[0]
+    out = np.empty((n, 3), dtype=np.float64)
+    for i in prange(n):
+        rx, ry, rz = base_pos[i, 0], base_pos[i, 1], base_pos[i, 2]
+        vx, vy, vz = base_vel[i, 0], base_vel[i, 1], base_vel[i, 2]
+        dx = check_pos[i, 0] - rx
+        dy = check_pos[i, 1] - ry
+        dz = check_pos[i, 2] - rz
+
+        # radial unit vector
+        r = np.sqrt(rx * rx + ry * ry + rz * rz)
+        qx, qy, qz = rx / r, ry / r, rz / r
+
+        # cross-track unit vector, along the angular momentum
+        hx = ry * vz - rz * vy
+        hy = rz * vx - rx * vz
+        hz = rx * vy - ry * vx
+        h = np.sqrt(hx * hx + hy * hy + hz * hz)
+        wx, wy, wz = hx / h, hy / h, hz / h
+
+        # in-track unit vector, completing the right-handed triad
+        sx = wy * qz - wz * qy
+        sy = wz * qx - wx * qz
+        sz = wx * qy - wy * qx
+
+        out[i, 0] = qx * dx + qy * dy + qz * dz
+        out[i, 1] = sx * dx + sy * dy + sz * dz
+        out[i, 2] = wx * dx + wy * dy + wz * dz
+    return out
+
+
+def _qsw_errors_numpy(
+    base_pos: np.ndarray, base_vel: np.ndarray, check_pos: np.ndarray
+) -> np.ndarray:
+    r_hat = base_pos / np.linalg.norm(base_pos, axis=1)[:, np.newaxis]
+    h = np.cross(base_pos, base_vel)
+    w_hat = h / np.linalg.norm(h, axis=1)[:, np.newaxis]
+    s_hat = np.cross(w_hat, r_hat)
+
+    delta = check_pos - base_pos
+    return np.stack(
+        [
+            np.einsum("ij,ij->i", r_hat, delta),
+            np.einsum("ij,ij->i", s_hat, delta),
+            np.einsum("ij,ij->i", w_hat, delta),
+        ],
+        axis=1,
+    )
+
+
+def _pos_vel_norms_loop(
+    ref_pos: np.ndarray,
+    ref_vel: np.ndarray,
+    check_pos: np.ndarray,
+    check_vel: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    n = ref_pos.shape[0]
+    pos = np.empty(n, dtype=np.float64)
+    vel = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        dx = ref_pos[i, 0] - check_pos[i, 0]
+        dy = ref_pos[i, 1] - check_pos[i, 1]
+        dz = ref_pos[i, 2] - check_pos[i, 2]
+        pos[i] = np.sqrt(dx * dx + dy * dy + dz * dz)
+
+        dvx = ref_vel[i, 0] - check_vel[i, 0]
+        dvy = ref_vel[i, 1] - check_vel[i, 1]
+        dvz = ref_vel[i, 2] - check_vel[i, 2]
+        vel[i] = np.sqrt(dvx * dvx + dvy * dvy + dvz * dvz)
+    return pos, vel
+
+
+def _pos_vel_norms_numpy(
+    ref_pos: np.ndarray,
+    ref_vel: np.ndarray,
+    check_pos: np.ndarray,
+    check_vel: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    dpos = ref_pos - check_pos
+    dvel = ref_vel - check_vel
+    return (
+        np.sqrt(np.einsum("ij,ij->i", dpos, dpos)),
+        np.sqrt(np.einsum("ij,ij->i", dvel, dvel)),
+    )
@@ -1,26 +1,53 @@
 from datetime import timedelta
 import argparse
+import functools
 import isodate
 import logging
+import math
 import orekitfactory
 
 import orbit_tool.utils as utils
 from org.orekit.time import AbsoluteDate
 
+_DEFAULT_STEP = timedelta(minutes=10)
+"""Propagation step used when neither the arguments nor the config provide one."""
 
-def to_timedelta(value) -> timedelta:
-    if value is None:
-        return timedelta()
+_DEFAULT_DURATION_SECS = timedelta(weeks=2).total_seconds()
+"""Propagation duration (seconds) used when no duration or stop date is provided."""
+
+
+def to_timedelta(value: str | timedelta | int | float | None) -> timedelta:
+    if isinstance(value, str):
+        return _parse_iso(value)
     elif isinstance(value, timedelta):
         return value
-    elif isinstance(value, str):
-        return isodate.parse_duration(value)
-    elif isinstance(value, int) or isinstance(value, float):
+    elif isinstance(value, (int, float)):
         return timedelta(seconds=float(value))
+    elif value is None:
+        return timedelta()
     else:
         raise ValueError(f"Failed to convert value to timedelta. Value={value}")
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_iso(value: str) -> timedelta:
+    return isodate.parse_duration(value)
+
+
+def sample_count(start: AbsoluteDate, stop: AbsoluteDate, step: timedelta) -> int:
+    """Compute the number of samples on the grid ``start + i * step``, up to ``stop``.
+
+    Args:
+        start (AbsoluteDate): The first sample date.
+        stop (AbsoluteDate): The last allowable sample date (inclusive).
+        step (timedelta): The sample spacing.
+
+    Returns:
+        int: The number of samples, including the one at ``start``.
+    """
+    return int(math.floor(stop.durationFrom(start) / step.total_seconds())) + 1
+
+
 def start_stop_step(
     args: argparse.Namespace, config: dict, orbitdate: AbsoluteDate
 ) -> tuple[AbsoluteDate, AbsoluteDate, timedelta]:
@@ -30,7 +57,7 @@ def start_stop_step(
     elif "step" in config:
         step = to_timedelta(config["step"])
     else:
-        step = timedelta(minutes=10)
+        step = _DEFAULT_STEP
 
     if step <= timedelta():
         raise RuntimeError("Invalid step. Durations must be greater than zero.")
@@ -53,7 +80,7 @@ def start_stop_step(
     elif "stop" in args:
         stop_date = orekitfactory.to_absolute_date(args.stop)
     else:
-        stop_date = start_date.shiftedBy(timedelta(weeks=2).total_seconds())
+        stop_date = start_date.shiftedBy(_DEFAULT_DURATION_SECS)
 
     if start_date.isAfterOrEqualTo(stop_date):
         logging.getLogger(__name__).debug(
@@ -1,40 +1,56 @@
-from enum import Enum, auto
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import Enum
 
 from org.orekit.data import DataContext
 from org.orekit.orbits import Orbit, CircularOrbit, EquinoctialOrbit
 from org.orekit.propagation.analytical.tle import TLE
 
-import astropy.units as u
+import functools
 import logging
 import orekitfactory
 import orekitfactory.factory
+import os.path
 import requests
+import requests.adapters
+import threading
+import time
 
 from orekitfactory.utils import validate_quantity
 
+_LOG = logging.getLogger(__name__)
+
+_TLE_BIT = 0x01
+"""Bit set in the value of the TLE orbit type."""
+
+_AUTO_SELECT_BIT = 0x02
+"""Bit set in the value of the AUTO_SELECT orbit type."""
+
 
 class OrbitType(Enum):
-    TLE = auto()
-    KEPLERIAN = auto()
-    CIRCULAR = auto()
-    EQUINOCTIAL = auto()
-    AUTO_SELECT = auto()
+    # values are distinct bits, so compatibility reduces to integer masking
+    TLE = _TLE_BIT
+    KEPLERIAN = 0x04
+    CIRCULAR = 0x08
+    EQUINOCTIAL = 0x10
+    AUTO_SELECT = _AUTO_SELECT_BIT
 
     @staticmethod
     def compatible_with(a, b) -> bool:
-        if a is OrbitType.TLE and b is OrbitType.TLE:
-            return True
-        elif a is not OrbitType.TLE and b is not OrbitType.TLE:
-            return True
-        elif a is OrbitType.AUTO_SELECT or b is OrbitType.AUTO_SELECT:
-            return True
-        else:
-            return False
+        # anything other than an orbit type (e.g. None) counts as neither TLE nor
+        # AUTO_SELECT, as in the original predicate
+        a, b = getattr(a, "value", 0), getattr(b, "value", 0)
+
+        # either side auto-selects, or both or neither are TLEs
+        return bool((a | b) & _AUTO_SELECT_BIT) or (a & _TLE_BIT) == (b & _TLE_BIT)
 
 
 def read_orbit(
-    orbit_name: str = None, config: dict = None, context: DataContext = None, **kwargs
-) -> tuple[Orbit | TLE, OrbitType]:
+    orbit_name: str | None = None,
+    config: dict | None = None,
+    context: DataContext | None = None,
+    **kwargs,
+) -> tuple[Orbit | TLE | None, OrbitType | None]:
     """Read an orbit based on the orbit name
 
     Args:
@@ -45,14 +61,9 @@ def read_orbit(
         ValueError: _description_
 
     Returns:
-        tuple[Orbit | TLE, OrbitType]: _description_
+        tuple[Orbit | TLE | None, OrbitType | None]: _description_
     """
 
-    circular_threshold = float(config.get("circular_threshold", 1.0e-3))
-    equatoral_threshold = validate_quantity(
-        config.get("equatoral_threshold", 0.001), u.deg
-    )
-
     orbit_def = {}
     if orbit_name:
         orbit_def = config[orbit_name]
@@ -60,53 +71,249 @@ def read_orbit(
         if not orbit_def:
             raise ValueError(f"No orbit definition found for {orbit_name}.")
 
-    if "catnr" in orbit_def:
-        return (
-            _load_tle_from_catalog(orbit_def["catnr"], context=context),
-            OrbitType.TLE,
-        )
-    elif "line1" in orbit_def:
-        return (
-            orekitfactory.factory.to_tle(
-                orbit_def["line1"], orbit_def["line2"], context=context
-            ),
-            OrbitType.TLE,
-        )
-    elif "a" in orbit_def:
-        orbit = orekitfactory.factory.to_orbit(**orbit_def, context=context)
-        circular = orbit.getE() < circular_threshold
-        equatoral = orbit.getI() < float(equatoral_threshold.to_value(u.rad))
-
-        if circular and not equatoral:
-            return (CircularOrbit(orbit), OrbitType.CIRCULAR)
-        elif circular or equatoral:
-            return (EquinoctialOrbit(orbit), OrbitType.EQUINOCTIAL)
-        return (
-            orbit,
-            OrbitType.KEPLERIAN,
-        )
-    else:
-        logging.getLogger(__name__).warn("Unable to load orbit for defintion")
+    # the first matching key, in priority order, selects the loader
+    key = next((k for k in _LOADERS if k in orbit_def), None)
+    if key is None:
+        _LOG.warning("Unable to load orbit for defintion")
 
         return (None, None)
 
+    return _LOADERS[key](orbit_def, config, context)
+
+
+def _from_catnr(
+    orbit_def: dict, config: dict, context: DataContext | None
+) -> tuple[TLE, OrbitType]:
+    return (
+        _load_tle_from_catalog(orbit_def["catnr"], context=context),
+        OrbitType.TLE,
+    )
+
+
+def _from_tle_lines(
+    orbit_def: dict, config: dict, context: DataContext | None
+) -> tuple[TLE, OrbitType]:
+    return (
+        orekitfactory.factory.to_tle(
+            orbit_def["line1"], orbit_def["line2"], context=context
+        ),
+        OrbitType.TLE,
+    )
+
+
+def _from_elements(
+    orbit_def: dict, config: dict, context: DataContext | None
+) -> tuple[Orbit, OrbitType]:
+    orbit = orekitfactory.factory.to_orbit(**orbit_def, context=context)
+    circular_threshold, equatoral_threshold = _thresholds(config)
+    circular = orbit.getE() < circular_threshold
+    equatoral = orbit.getI() < equatoral_threshold
+
+    if circular and not equatoral:
+        return (CircularOrbit(orbit), OrbitType.CIRCULAR)
+    elif circular or equatoral:
+        return (EquinoctialOrbit(orbit), OrbitType.EQUINOCTIAL)
+    return (
+        orbit,
+        OrbitType.KEPLERIAN,
+    )
+
+
+_LOADERS = {
+    "catnr": _from_catnr,
+    "line1": _from_tle_lines,
+    "a": _from_elements,
+}
+"""Orbit loaders, by the orbit definition key identifying them, in priority order."""
+
+
+def read_orbits(
+    orbit_names: list[str], config: dict, context: DataContext | None = None
+) -> list[tuple[Orbit | TLE | None, OrbitType | None]]:
+    """Read several orbits, fetching their catalog TLEs together.
+
+    The catalog TLEs of all the orbits are downloaded concurrently before any orbit
+    is read, and an orbit named more than once is only read once.
+
+    Args:
+        orbit_names (list[str]): The names of the orbits to read.
+        config (dict): The orbits configuration.
+        context (DataContext, optional): The orekit data context. Defaults to None.
+
+    Returns:
+        list[tuple[Orbit | TLE | None, OrbitType | None]]: The orbits and their
+        types, in the order of `orbit_names`.
+    """
+    prefetch_tles(orbit_names, config)
+
+    orbits = {}
+    for name in orbit_names:
+        if name not in orbits:
+            orbits[name] = read_orbit(orbit_name=name, config=config, context=context)
+
+    return [orbits[name] for name in orbit_names]
+
+
+def _thresholds(config: dict) -> tuple[float, float]:
+    """Read the orbit classification thresholds from the orbits configuration.
+
+    Args:
+        config (dict): The orbits configuration.
+
+    Returns:
+        tuple[float, float]: The circular (eccentricity) threshold and the
+        equatorial (inclination) threshold, in radians.
+    """
+    circular = float(config.get("circular_threshold", 1.0e-3))
+
+    # precomputed by configuration.normalize_config, when loaded from file
+    equatoral = config.get("equatoral_threshold_rad")
+    if equatoral is None:
+        equatoral = _parse_equatoral_threshold(config.get("equatoral_threshold", 0.001))
+
+    return circular, equatoral
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_equatoral_threshold(value) -> float:
+    import astropy.units as u
+
+    return float(validate_quantity(value, u.deg).to_value(u.rad))
+
+
+_POOL_MAXSIZE = 8
+"""Maximum number of pooled connections per host, and of concurrent downloads."""
+
+_SESSION = requests.Session()
+"""HTTP session, reusing connections across catalog requests."""
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE),
+)
+_SESSION.headers.update(
+    {
+        "accept": "*/*",
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.84 Safari/537.36",  # noqa: E501
+    }
+)
+
+_CATALOG_TIMEOUT = 10.0
+"""Timeout (seconds) of catalog requests."""
+
+_TLE_LINES: dict[int, Future] = {}
+"""Catalog TLE loads in flight, by catnr."""
+
+_TLE_LINES_LOCK = threading.Lock()
+"""Lock guarding `_TLE_LINES`."""
+
+_TLE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "orbit_tool", "tle")
+"""Directory holding the TLEs downloaded from the catalog."""
+
+_TLE_CACHE_MAX_AGE = timedelta(hours=6).total_seconds()
+"""Maximum age (seconds) of a cached TLE before it is downloaded again."""
+
+
+def prefetch_tles(orbit_names: list[str], config: dict):
+    """Download the catalog TLEs of several orbits concurrently.
+
+    The TLEs are stored in the on-disk cache, so later calls to `read_orbit` for
+    these orbits do not wait on the network one catalog number at a time.
+
+    Args:
+        orbit_names (list[str]): The names of the orbits about to be read.
+        config (dict): The orbits configuration.
+    """
+    catnrs = {
+        int(config[name]["catnr"])
+        for name in orbit_names
+        if config.get(name) and "catnr" in config[name]
+    }
+    if len(catnrs) < 2:
+        return
+
+    # never exceed the session's connection pool (nor hammer the catalog)
+    with ThreadPoolExecutor(max_workers=min(len(catnrs), _POOL_MAXSIZE)) as executor:
+        list(executor.map(_load_tle_lines, catnrs))
+
 
 def _load_tle_from_catalog(catnr, context: DataContext = None) -> TLE:
-    catnr = int(catnr)
-    r = requests.get(
+    lines = _load_tle_lines(int(catnr))
+    return orekitfactory.to_tle(lines[1], lines[2], context=context)
+
+
+def _load_tle_lines(catnr: int) -> tuple[str, ...]:
+    # concurrent callers for the same catnr wait on the first caller's result
+    with _TLE_LINES_LOCK:
+        future = _TLE_LINES.get(catnr)
+        owner = future is None
+        if owner:
+            future = _TLE_LINES[catnr] = Future()
+
+    if owner:
+        try:
+            lines = _read_cached_tle(catnr)
+            if lines is None:
+                lines = _fetch_tle(catnr)
+                _write_cached_tle(catnr, lines)
+            future.set_result(tuple(lines))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            # only in-flight loads are shared, repeats are served by the disk cache
+            with _TLE_LINES_LOCK:
+                _TLE_LINES.pop(catnr, None)
+
+    return future.result()
+
+
+def _fetch_tle(catnr: int) -> list[str]:
+    r = _SESSION.get(
         f"https://celestrak.com/NORAD/elements/gp.php?CATNR={catnr}&FORMAT=TLE",
-        headers={
-            "accept": "*/*",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.84 Safari/537.36",  # noqa: E501
-        },
+        timeout=_CATALOG_TIMEOUT,
     )
-    if not r.status_code == 200:
-        logging.getLogger(__name__).error(
-            "Failed to load tle for catnr %d. HTTP return code: %d",
-            catnr,
-            r.status_code,
-        )
-        raise RuntimeError(f"failed to load TLE for catalog number {catnr}")
-
-    data = r.content.splitlines()
-    return orekitfactory.to_tle(data[1], data[2], context=context)
+    try:
+        r.raise_for_status()
+    except requests.HTTPError as e:
+        _LOG.error("Failed to load tle for catnr %d: %s", catnr, e)
+        raise RuntimeError(f"failed to load TLE for catalog number {catnr}") from e
+
+    # only the name and the two element lines are needed; the body is read in full
+    # so the connection goes back to the session's pool
+    lines = r.text.splitlines()[:3]
+
+    if len(lines) < 3:
+        raise RuntimeError(f"no TLE found for catalog number {catnr}")
+
+    return lines
+
+
+def _tle_cache_path(catnr: int) -> str:
+    day = datetime.now(timezone.utc).strftime("%Y%m%d")
+    return os.path.join(_TLE_CACHE_DIR, f"{catnr}-{day}.txt")
+
+
+def _read_cached_tle(catnr: int) -> list[str] | None:
+    path = _tle_cache_path(catnr)
+    try:
+        if time.time() - os.path.getmtime(path) >= _TLE_CACHE_MAX_AGE:
+            return None
+        with open(path, "r") as file:
+            lines = file.read().splitlines()
+    except OSError:
+        return None
+
+    if len(lines) < 3:
+        return None
+
+    _LOG.debug("Loaded cached tle for catnr %d", catnr)
+    return lines
+
+
+def _write_cached_tle(catnr: int, lines: list[str]):
+    path = _tle_cache_path(catnr)
+    try:
+        os.makedirs(_TLE_CACHE_DIR, exist_ok=True)
+        with open(path, "w") as file:
+            file.write("\n".join(lines[:3]))
+    except OSError:
+        _LOG.debug("Failed to cache tle path=%s", path, exc_info=1)
@@ -0,0 +1,90 @@
+"""Fixed-step sampling of propagators."""
+from datetime import timedelta
+from typing import Callable
+
+from org.orekit.propagation import Propagator, SpacecraftState
+from org.orekit.propagation.sampling import PythonOrekitFixedStepHandler
+from org.orekit.time import AbsoluteDate
+
+from .duration import sample_count
+
+
+class FixedStepSampler(PythonOrekitFixedStepHandler):
+    """Fixed-step handler passing each sampled state, with its index, to a callback."""
+
+    def __init__(self, callback: Callable[[int, SpacecraftState], None], limit: int):
+        """Class constructor.
+
+        Args:
+            callback (Callable[[int, SpacecraftState], None]): Function called with the
+            sample index and state at each step.
+            limit (int): The maximum number of samples to pass to the callback.
+        """
+        super().__init__()
+        self.callback = callback
+        self.limit = limit
+        self.count = 0
+
+    def init(self, s0, t, step):
+        """Initialize the handler.
+
+        Args:
+            s0 (SpacecraftState): The initial state.
+            t (AbsoluteDate): The target date.
+            step (float): The step size, in seconds.
+        """
+        self.count = 0
+
+    def handleStep(self, currentState):
+        """Handle a single step.
+
+        Args:
+            currentState (SpacecraftState): The state at the current step.
+        """
+        if self.count < self.limit:
+            self.callback(self.count, currentState)
+            self.count = self.count + 1
+
+    def finish(self, finalState):
+        """Finalize the propagation.
+
+        Args:
+            finalState (SpacecraftState): The state at the end of the propagation.
+        """
+        pass
+
+
+def sample_states(
+    propagator: Propagator,
+    start: AbsoluteDate,
+    stop: AbsoluteDate,
+    step: timedelta,
+    callback: Callable[[int, SpacecraftState], None],
+) -> int:
+    """Sample a propagator on a fixed-step grid, in a single propagation.
+
+    The propagator runs once from ``start`` to ``stop``, and ``callback`` is invoked
+    with the index and state of each sample ``start + i * step``, rather than
+    restarting the propagation at every sample date.
+
+    Args:
+        propagator (Propagator): The propagator to sample.
+        start (AbsoluteDate): The first sample date.
+        stop (AbsoluteDate): The last allowable sample date (inclusive).
+        step (timedelta): The sample spacing.
+        callback (Callable[[int, SpacecraftState], None]): Function called with the
+        sample index and state at each step.
+
+    Returns:
+        int: The number of samples passed to the callback. This never exceeds
+        `sample_count(start, stop, step)`, so callers may preallocate their buffers.
+    """
+    handler = FixedStepSampler(callback, sample_count(start, stop, step))
+    multiplexer = propagator.getMultiplexer()
+    multiplexer.add(step.total_seconds(), handler)
+    try:
+        propagator.propagate(start, stop)
+    finally:
+        multiplexer.remove(handler)
+
+    return handler.count
@@ -0,0 +1,72 @@
+"""Tests for the numeric kernels."""
+import numpy as np
+import pytest
+
+from orbit_tool.utils import _fastmath
+
+
+def _random_states(n: int = 64, seed: int = 1234):
+    rng = np.random.default_rng(seed)
+    base_pos = rng.normal(size=(n, 3)) * 7.0e6
+    base_vel = rng.normal(size=(n, 3)) * 7.5e3
+    check_pos = base_pos + rng.normal(size=(n, 3)) * 1.0e3
+    check_vel = base_vel + rng.normal(size=(n, 3))
+    return base_pos, base_vel, check_pos, check_vel
+
+
+def _reference_qsw(base_pos, base_vel, check_pos):
+    out = np.empty_like(base_pos)
+    for i, (r, v, c) in enumerate(zip(base_pos, base_vel, check_pos)):
+        q = r / np.linalg.norm(r)
+        w = np.cross(r, v)
+        w = w / np.linalg.norm(w)
+        s = np.cross(w, q)
+        basis = np.vstack([q, s, w])
+        out[i] = basis @ (c - r)
+    return out
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [_fastmath._qsw_errors_loop, _fastmath._qsw_errors_numpy, _fastmath.qsw_errors],
+)
+def test_qsw_errors_matches_reference(kernel):
+    base_pos, base_vel, check_pos, _ = _random_states()
+
+    actual = kernel(base_pos, base_vel, check_pos)
+
+    np.testing.assert_allclose(
+        actual, _reference_qsw(base_pos, base_vel, check_pos), rtol=0, atol=1e-6
+    )
+
+
+def test_qsw_errors_axes():
+    # circular orbit in the xy plane: radial along x, in-track along y, cross along z
+    base_pos = np.array([[7.0e6, 0.0, 0.0]])
+    base_vel = np.array([[0.0, 7.5e3, 0.0]])
+    check_pos = base_pos + np.array([[1.0, 2.0, 3.0]])
+
+    np.testing.assert_allclose(
+        _fastmath.qsw_errors(base_pos, base_vel, check_pos), [[1.0, 2.0, 3.0]]
+    )
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        _fastmath._pos_vel_norms_loop,
+        _fastmath._pos_vel_norms_numpy,
+        _fastmath.pos_vel_norms,
+    ],
+)
+def test_pos_vel_norms_matches_reference(kernel):
+    base_pos, base_vel, check_pos, check_vel = _random_states()
+
+    pos, vel = kernel(base_pos, base_vel, check_pos, check_vel)
+
+    np.testing.assert_allclose(
+        pos, np.linalg.norm(base_pos - check_pos, axis=1), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        vel, np.linalg.norm(base_vel - check_vel, axis=1), rtol=1e-12
+    )
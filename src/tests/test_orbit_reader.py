@@ -0,0 +1,79 @@
+"""Tests for the orbit reader."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from orbit_tool.utils import orbit_reader
+from orbit_tool.utils.orbit_reader import OrbitType
+
+
+def _original_compatible_with(a, b) -> bool:
+    if a is OrbitType.TLE and b is OrbitType.TLE:
+        return True
+    elif a is not OrbitType.TLE and b is not OrbitType.TLE:
+        return True
+    elif a is OrbitType.AUTO_SELECT or b is OrbitType.AUTO_SELECT:
+        return True
+    else:
+        return False
+
+
+@pytest.mark.parametrize("a", list(OrbitType))
+@pytest.mark.parametrize("b", list(OrbitType))
+def test_compatible_with_truth_table(a, b):
+    assert OrbitType.compatible_with(a, b) == _original_compatible_with(a, b)
+
+
+def test_compatible_with_non_member():
+    # convert-orbit passes None as the seed type when --seed-orbit is omitted
+    assert OrbitType.compatible_with(None, OrbitType.KEPLERIAN)
+    assert OrbitType.compatible_with(None, OrbitType.AUTO_SELECT)
+    assert not OrbitType.compatible_with(None, OrbitType.TLE)
+    assert not OrbitType.compatible_with(OrbitType.TLE, None)
+
+
+def test_concurrent_catalog_loads_are_coalesced(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fetch(catnr):
+        calls.append(catnr)
+        release.wait(5.0)
+        return ["NAME", "line1", "line2"]
+
+    monkeypatch.setattr(orbit_reader, "_read_cached_tle", lambda catnr: None)
+    monkeypatch.setattr(orbit_reader, "_write_cached_tle", lambda catnr, lines: None)
+    monkeypatch.setattr(orbit_reader, "_fetch_tle", fetch)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(orbit_reader._load_tle_lines, 25544) for _ in "abcd"]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert calls == [25544]
+    assert results == [("NAME", "line1", "line2")] * 4
+    # completed loads are not retained in memory
+    assert 25544 not in orbit_reader._TLE_LINES
+
+
+def test_failed_catalog_load_is_retried(monkeypatch):
+    attempts = []
+
+    def fetch(catnr):
+        attempts.append(catnr)
+        if len(attempts) == 1:
+            raise RuntimeError("unavailable")
+        return ["NAME", "line1", "line2"]
+
+    monkeypatch.setattr(orbit_reader, "_read_cached_tle", lambda catnr: None)
+    monkeypatch.setattr(orbit_reader, "_write_cached_tle", lambda catnr, lines: None)
+    monkeypatch.setattr(orbit_reader, "_fetch_tle", fetch)
+
+    with pytest.raises(RuntimeError):
+        orbit_reader._load_tle_lines(43013)
+
+    assert orbit_reader._load_tle_lines(43013) == ("NAME", "line1", "line2")
+    assert attempts == [43013, 43013]